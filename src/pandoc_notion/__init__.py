@@ -5,5 +5,17 @@ This package provides a modular approach to convert Pandoc documents to Notion f
 using managers for different block types.
 """
 
-__all__ = []
+from pandoc_notion.filter import (
+    Filter,
+    convert_markdown_to_notion,
+    filter_markdown_to_notion,
+    markdown_batch_to_notion,
+)
+
+__all__ = [
+    'Filter',
+    'convert_markdown_to_notion',
+    'filter_markdown_to_notion',
+    'markdown_batch_to_notion',
+]
 
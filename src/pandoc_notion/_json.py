@@ -0,0 +1,49 @@
+"""
+JSON serialization helpers.
+
+Uses orjson when it is installed (the optional 'fastjson' extra) and falls
+back to the standard library otherwise. Both helpers produce UTF-8 bytes.
+"""
+
+import json
+from typing import Any, BinaryIO
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serialize obj to JSON bytes.
+
+    Args:
+        obj: JSON-serializable object
+        indent: Indent nested structures by two spaces
+
+    Returns:
+        The UTF-8 encoded JSON document
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None).encode('utf-8')
+
+
+def dump(obj: Any, fp: BinaryIO, indent: bool = False) -> None:
+    """
+    Write obj as JSON to the binary file fp.
+
+    Without orjson, stdlib output is streamed chunk by chunk so the whole
+    document is never held as one string.
+
+    Args:
+        obj: JSON-serializable object
+        fp: File object opened in binary mode
+        indent: Indent nested structures by two spaces
+    """
+    if orjson is not None:
+        fp.write(dumps(obj, indent))
+        return
+    for chunk in json.JSONEncoder(indent=2 if indent else None).iterencode(obj):
+        fp.write(chunk.encode('utf-8'))
@@ -0,0 +1,46 @@
+"""
+Debug tracing helpers for pandoc_notion.
+
+Wraps python_debug's tracer so that decorated functions only pay for tracing
+when debugging is actually enabled.
+"""
+
+import os
+import logging
+from typing import Any, Callable
+
+logger = logging.getLogger('pandoc_notion')
+
+# Force tracing on regardless of logging configuration; read once at import
+# because decorators are applied when the modules are first loaded
+DEBUG_ENABLED = os.environ.get('PANDOC_NOTION_DEBUG') == '1'
+
+
+def debug_trace(*args: Any, **kwargs: Any) -> Callable[[Callable], Callable]:
+    """
+    Decorator factory with the same signature as python_debug.debug_trace.
+
+    The decision is made when the decorator is created: unless
+    PANDOC_NOTION_DEBUG=1 is set or the 'pandoc_notion' logger is enabled for
+    DEBUG at that point, the function is returned unwrapped and calls to it
+    carry no tracing overhead. Configure logging before importing
+    pandoc_notion to get traces.
+
+    Args:
+        *args: Positional arguments forwarded to python_debug.debug_trace
+        **kwargs: Keyword arguments forwarded to python_debug.debug_trace
+
+    Returns:
+        A decorator that either traces the function or returns it as-is
+    """
+    if not (DEBUG_ENABLED or logger.isEnabledFor(logging.DEBUG)):
+        return _identity
+    
+    # Only load the tracer when something is actually going to be traced
+    from python_debug import debug_trace as _debug_trace
+    return _debug_trace(*args, **kwargs)
+
+
+def _identity(func: Callable) -> Callable:
+    """Decorator that returns the function unchanged."""
+    return func
@@ -9,23 +9,219 @@ This module provides:
 4. Comprehensive debug output when enabled
 """
 
+import io
 import os
+import re
 import sys
-import json
+import copy
+import time
+import atexit
+import shutil
+import socket
+import hashlib
 import logging
-from typing import Dict, List, Any, Optional, Union
+import threading
+import subprocess
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, List, Any, Iterable, Optional, Union
 
 import panflute as pf
-import pypandoc
 # Import debug_trace for detailed diagnostics
-from python_debug import debug_trace
+from pandoc_notion.debug import debug_trace
 
+from pandoc_notion import _json
 from pandoc_notion.registry import ManagerRegistry
+from pandoc_notion.managers.registry_mixin import set_registry
 
 
 # Configure module logger
 logger = logging.getLogger('pandoc_notion.filter')
 
+# Paragraph placed between inputs when several strings share one pandoc run
+_BATCH_TOKEN = "CD985272F78311"
+# Bracketed references (reference links and their definitions, footnotes,
+# implicit header references, citations) and example list labels resolve
+# across the whole pandoc document, so texts containing them cannot safely
+# share a batch. Only inline links, whose "]" is followed by "(", are safe.
+_DOC_WIDE_MARKUP = re.compile(r'\](?!\()|\(@')
+
+
+class _PandocServer:
+    """
+    A `pandoc server` process kept alive for the lifetime of the interpreter.
+    
+    Spawning pandoc for every conversion pays its startup cost each time.
+    When PANDOC_NOTION_SERVER=1 is set, conversions are sent over HTTP to a
+    single server started on first use. Not every pandoc build ships a working
+    server, so callers fall back to a one-shot pandoc run whenever
+    instance() returns None.
+    """
+    
+    _instance = None
+    _failed = False
+    _lock = threading.Lock()
+    
+    STARTUP_TIMEOUT = 10.0
+    # Seconds to wait for a conversion before treating the server as hung
+    REQUEST_TIMEOUT = 60.0
+    
+    def __init__(self):
+        """Start the server on a free local port and wait until it accepts connections."""
+        self.port = self._find_free_port()
+        self.url = f"http://127.0.0.1:{self.port}/"
+        self.process = subprocess.Popen(
+            [_pandoc_path(), 'server', '--port', str(self.port)],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
+        atexit.register(self.terminate)
+        self._wait_until_ready()
+    
+    @classmethod
+    def instance(cls) -> Optional['_PandocServer']:
+        """Return the shared server, starting it on first use, or None if unavailable."""
+        if cls._instance is None and not cls._failed:
+            with cls._lock:
+                if cls._instance is None and not cls._failed:
+                    try:
+                        cls._instance = cls()
+                        logger.debug("Started pandoc server on port %d", cls._instance.port)
+                    except (OSError, subprocess.SubprocessError) as e:
+                        cls._failed = True
+                        logger.warning("pandoc server unavailable, running pandoc per conversion: %s", e)
+        return cls._instance
+    
+    @classmethod
+    def discard(cls) -> None:
+        """Stop using the shared server, e.g. after it stopped responding."""
+        with cls._lock:
+            if cls._instance is not None:
+                cls._instance.terminate()
+            cls._instance = None
+            cls._failed = True
+    
+    @staticmethod
+    def _find_free_port() -> int:
+        """Ask the OS for a currently unused local port."""
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.bind(('127.0.0.1', 0))
+            return sock.getsockname()[1]
+    
+    def _wait_until_ready(self) -> None:
+        """Poll the server port until it accepts connections."""
+        deadline = time.monotonic() + self.STARTUP_TIMEOUT
+        while True:
+            try:
+                with socket.create_connection(('127.0.0.1', self.port), timeout=0.5):
+                    return
+            except OSError:
+                if self.process.poll() is not None or time.monotonic() > deadline:
+                    self.terminate()
+                    raise OSError("pandoc server did not accept connections")
+                time.sleep(0.05)
+    
+    def convert(self, text: str, format: str) -> str:
+        """
+        Convert text to a pandoc JSON AST using the running server.
+        
+        Args:
+            text: The text to convert
+            format: The format of the input text
+            
+        Returns:
+            The pandoc JSON AST as a string
+            
+        Raises:
+            OSError: If the server cannot be reached or does not answer
+                within REQUEST_TIMEOUT
+        """
+        # urllib is only needed when the server is in use
+        import urllib.error
+        import urllib.request
+        
+        payload = _json.dumps({"text": text, "from": format, "to": "json"})
+        request = urllib.request.Request(
+            self.url,
+            data=payload,
+            headers={'Content-Type': 'application/json'}
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=self.REQUEST_TIMEOUT) as response:
+                return response.read().decode('utf-8')
+        except urllib.error.HTTPError as e:
+            # The server is fine; pandoc rejected the input
+            raise RuntimeError(f"pandoc server error: {e.read().decode('utf-8', 'replace')}") from e
+    
+    def terminate(self) -> None:
+        """Stop the server process if it is still running."""
+        if self.process.poll() is None:
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+
+
+@lru_cache(maxsize=1)
+def _pandoc_path() -> str:
+    """
+    Locate the pandoc executable on PATH, once per process.
+    
+    Raises:
+        OSError: If pandoc is not installed
+    """
+    path = shutil.which('pandoc')
+    if path is None:
+        raise OSError("pandoc executable not found on PATH")
+    return path
+
+
+def _run_pandoc(text: str, format: str) -> str:
+    """
+    Run pandoc once to convert text to a JSON AST string.
+    
+    Args:
+        text: Source text
+        format: Pandoc input format
+        
+    Returns:
+        The JSON AST produced by pandoc
+        
+    Raises:
+        RuntimeError: If pandoc exits with an error
+    """
+    proc = subprocess.run(
+        [_pandoc_path(), '--from', format, '--to', 'json'],
+        input=text.encode('utf-8'),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(
+            f"pandoc exited with code {proc.returncode}: {proc.stderr.decode('utf-8', 'replace').strip()}"
+        )
+    return proc.stdout.decode('utf-8')
+
+
+def _convert_to_json(text: str, format: str) -> str:
+    """
+    Convert text to a pandoc JSON AST string.
+    
+    Uses the shared pandoc server when PANDOC_NOTION_SERVER=1 is set and the
+    server is available, otherwise runs pandoc once for this conversion.
+    """
+    if os.environ.get('PANDOC_NOTION_SERVER') == '1':
+        server = _PandocServer.instance()
+        if server is not None:
+            try:
+                return server.convert(text, format)
+            # URLError, ConnectionError and socket timeouts are all OSErrors
+            except OSError as e:
+                logger.warning("pandoc server stopped responding, running pandoc per conversion: %s", e)
+                _PandocServer.discard()
+    return _run_pandoc(text, format)
+
 
 class Filter:
     """
@@ -33,12 +229,25 @@ class Filter:
     
     This class handles the conversion process:
     markdown -> pandoc AST -> panflute Doc -> Notion blocks
+    
+    Each conversion makes the filter's registry the one managers share through
+    RegistryMixin, which is process-wide. Filters sharing a registry (such as
+    the default one) can convert from several threads, but filters with
+    different registries must not convert concurrently.
     """
     
-    def __init__(self):
-        """Initialize the filter."""
+    __slots__ = ('registry',)
+    
+    def __init__(self, registry: Optional[ManagerRegistry] = None):
+        """
+        Initialize the filter.
+        
+        Args:
+            registry: Manager registry to convert with. Defaults to a registry
+                      of the default managers shared by all filters.
+        """
         logger.debug("Initializing Filter")
-        self.registry = ManagerRegistry()  # Initialize with default managers
+        self.registry = registry or _default_registry()
     
     @debug_trace()
     def convert_string(self, text: str, format: str = "markdown") -> Dict[str, Any]:
@@ -52,10 +261,68 @@ class Filter:
         Returns:
             Dictionary containing Notion blocks
         """
-        logger.debug(f"Converting string (format: {format})")
+        logger.debug("Converting string (format: %s)", format)
         doc = self._string_to_doc(text, format)
         return self.to_notion_dict(doc)
 
+    @debug_trace()
+    def convert_strings(self, texts: List[str], format: str = "markdown") -> List[Dict[str, Any]]:
+        """
+        Convert several strings to Notion blocks with a single pandoc run.
+        
+        The inputs are joined with a sentinel paragraph, converted in one pass
+        and split back apart on that paragraph. If the split does not yield one
+        part per input (e.g. an unterminated code fence swallowed a sentinel),
+        each string is converted on its own instead.
+        
+        References that pandoc resolves document-wide (reference links and
+        definitions, footnotes, implicit header references, example list
+        labels) would be visible across inputs sharing one pandoc document, so
+        a batch containing any bracketed reference or example label is also
+        converted one string at a time.
+        
+        Args:
+            texts: The texts to convert
+            format: The format of the input texts
+            
+        Returns:
+            List of dictionaries containing Notion blocks, one per input text
+        """
+        logger.debug("Converting %d strings in one batch (format: %s)", len(texts), format)
+        if not texts:
+            return []
+        
+        if any(_DOC_WIDE_MARKUP.search(text) for text in texts):
+            logger.debug("Batch contains document-wide references; converting individually")
+            return [self.convert_string(text, format) for text in texts]
+        
+        separator = f"\n\n{_BATCH_TOKEN}\n\n"
+        doc = self._string_to_doc(separator.join(texts), format)
+        
+        # Split the top-level blocks back into one partition per input
+        partitions = [[]]
+        for elem in doc.content:
+            if self._is_batch_token(elem):
+                partitions.append([])
+            else:
+                partitions[-1].append(elem)
+        
+        if len(partitions) != len(texts):
+            logger.debug("Batch split into %d parts for %d inputs; converting individually", len(partitions), len(texts))
+            return [self.convert_string(text, format) for text in texts]
+        
+        return [self.to_notion_dict(pf.Doc(*partition)) for partition in partitions]
+
+    @staticmethod
+    def _is_batch_token(elem: pf.Element) -> bool:
+        """Check if an element is the sentinel paragraph inserted by convert_strings."""
+        return (
+            isinstance(elem, pf.Para) and
+            len(elem.content) == 1 and
+            isinstance(elem.content[0], pf.Str) and
+            elem.content[0].text == _BATCH_TOKEN
+        )
+
     @debug_trace()
     def _string_to_doc(self, text: str, format: str = "markdown") -> pf.Doc:
         """
@@ -68,41 +335,24 @@ class Filter:
         Returns:
             A panflute Doc object
         """
-        logger.debug(f"Converting string to Doc (format: {format})")
+        logger.debug("Converting string to Doc (format: %s)", format)
         try:
             # Convert to pandoc JSON AST
-            ast_json = pypandoc.convert_text(text, 'json', format=format)
+            ast_json = _convert_to_json(text, format)
             logger.debug("Successfully converted to JSON AST")
             
-            # Parse the JSON AST
-            ast_dict = json.loads(ast_json)
-            logger.debug("Parsed JSON AST to dictionary")
+            # Parse the JSON AST straight into panflute elements in a single
+            # pass; pf.convert_text would spawn a second pandoc just to
+            # round-trip JSON back to JSON
+            doc = pf.load(io.StringIO(ast_json))
+            if not isinstance(doc, pf.Doc):
+                raise ValueError("Invalid JSON AST structure: not a pandoc document")
             
-            # Extract elements and metadata from the AST
-            if 'blocks' in ast_dict:
-                # Create Doc object from the blocks
-                blocks = ast_dict.get('blocks', [])
-                metadata = ast_dict.get('meta', {})
-                
-                # Convert JSON blocks to panflute elements
-                elements = pf.convert_text(ast_json, input_format='json', output_format='panflute')
-                
-                if isinstance(elements, list):
-                    # Create a new Doc with the elements
-                    doc = pf.Doc(*elements)
-                    logger.debug(f"Created Doc with {len(doc.content)} elements")
-                    return doc
-                elif isinstance(elements, pf.Doc):
-                    # If we got a Doc directly, return it
-                    logger.debug(f"Received Doc with {len(elements.content)} elements")
-                    return elements
-                else:
-                    raise TypeError(f"Unexpected result type: {type(elements)}")
-            else:
-                raise ValueError("Invalid JSON AST structure: missing 'blocks' key")
+            logger.debug("Loaded Doc with %d elements", len(doc.content))
+            return doc
             
         except Exception as e:
-            logger.error(f"Error converting string to Doc: {str(e)}")
+            logger.error("Error converting string to Doc: %s", e)
             logger.debug("Error details:", exc_info=True)
             raise
     
@@ -119,7 +369,7 @@ class Filter:
         """
         logger.debug("Converting Doc to Notion dict")
         blocks = self.to_notion_blocks(doc)
-        logger.debug(f"Generated {len(blocks)} blocks")
+        logger.debug("Generated %d blocks", len(blocks))
         return {"children": blocks}
     
     @debug_trace()
@@ -127,8 +377,7 @@ class Filter:
         """
         Convert a panflute Doc to a list of Notion blocks.
         
-        This method handles special cases like lists, ensuring they're
-        properly structured for consumption by the block hierarchy builder.
+        List items are returned as flat item blocks, one per item.
         
         Args:
             doc: The panflute Doc to convert
@@ -137,49 +386,46 @@ class Filter:
             List of Notion block dictionaries
         """
         logger.debug("Converting Doc to Notion blocks")
-        raw_blocks = self.registry.convert_elements_to_dicts(list(doc.content))
-        logger.debug(f"Initial conversion resulted in {len(raw_blocks)} blocks")
-        
-        # Process the blocks to handle list structures properly
-        processed_blocks = []
-        i = 0
-        
-        while i < len(raw_blocks):
-            current = raw_blocks[i]
-            
-            # Check if we're looking at a list item (bulleted or numbered)
-            if isinstance(current, dict) and current.get('type') in ['bulleted_list_item', 'numbered_list_item']:
-                # We found a list item, now let's collect all consecutive items of the same type
-                list_type = current.get('type')
-                items = [current]
-                j = i + 1
-                
-                # Collect subsequent items of the same type
-                while j < len(raw_blocks) and isinstance(raw_blocks[j], dict) and raw_blocks[j].get('type') == list_type:
-                    items.append(raw_blocks[j])
-                    j += 1
-                
-                logger.debug(f"Found {len(items)} {list_type} items in sequence")
-                
-                # Create a container block for the list items
-                container = {
-                    'object': 'block',
-                    'type': 'list_container',  # This is an internal type for our processing
-                    'list_container': {
-                        'list_type': list_type,
-                        'items': items
-                    }
-                }
-                
-                processed_blocks.append(container)
-                i = j  # Skip past the items we've processed
-            else:
-                # Regular block, add it as-is
-                processed_blocks.append(current)
-                i += 1
-        
-        logger.debug(f"Successfully processed into {len(processed_blocks)} blocks")
-        return processed_blocks
+        # Nested conversions (e.g. inside quotes) look managers up through the
+        # mixin's shared registry, which another registry or filter may have
+        # replaced since this filter was created
+        set_registry(self.registry)
+        raw_blocks = self.registry.convert_elements_to_dicts(doc.content)
+        logger.debug("Initial conversion resulted in %d blocks", len(raw_blocks))
+        return raw_blocks
+
+
+@lru_cache(maxsize=1)
+def _default_registry() -> ManagerRegistry:
+    """Return the registry of default managers, built once per process."""
+    return ManagerRegistry()
+
+
+_DEFAULT_FILTER: Optional[Filter] = None
+_DEFAULT_FILTER_LOCK = threading.Lock()
+
+
+def _default_filter() -> Filter:
+    """Return the Filter reused by the module-level conversion functions."""
+    global _DEFAULT_FILTER
+    if _DEFAULT_FILTER is None:
+        with _DEFAULT_FILTER_LOCK:
+            if _DEFAULT_FILTER is None:
+                _DEFAULT_FILTER = Filter()
+    return _DEFAULT_FILTER
+
+
+# Results of convert_markdown_to_notion keyed by a hash of the input,
+# kept only when PANDOC_NOTION_CACHE=1
+_CONVERSION_CACHE_SIZE = 512
+_CONVERSION_CACHE: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+_CONVERSION_CACHE_LOCK = threading.Lock()
+
+
+def _conversion_cache_clear() -> None:
+    """Drop all cached conversion results."""
+    with _CONVERSION_CACHE_LOCK:
+        _CONVERSION_CACHE.clear()
 
 
 @debug_trace()
@@ -187,6 +433,10 @@ def convert_markdown_to_notion(markdown: str) -> Dict[str, Any]:
     """
     Convert markdown text to Notion blocks.
     
+    When the PANDOC_NOTION_CACHE environment variable is set to 1, results
+    for recently converted inputs are reused instead of running pandoc
+    again. Each call still returns its own copy, so callers may mutate it.
+    
     Args:
         markdown: Markdown text to convert
         
@@ -194,8 +444,46 @@ def convert_markdown_to_notion(markdown: str) -> Dict[str, Any]:
         Dictionary containing Notion blocks
     """
     logger.debug("Converting markdown to Notion blocks")
-    filter = Filter()
-    return filter.convert_string(markdown)
+    if os.environ.get('PANDOC_NOTION_CACHE') != '1':
+        return _default_filter().convert_string(markdown)
+    
+    key = hashlib.blake2b(markdown.encode('utf-8'), digest_size=16).digest()
+    with _CONVERSION_CACHE_LOCK:
+        cached = _CONVERSION_CACHE.get(key)
+        if cached is not None:
+            _CONVERSION_CACHE.move_to_end(key)
+    if cached is not None:
+        logger.debug("Conversion cache hit")
+        return copy.deepcopy(cached)
+    
+    result = _default_filter().convert_string(markdown)
+    with _CONVERSION_CACHE_LOCK:
+        _CONVERSION_CACHE[key] = copy.deepcopy(result)
+        while len(_CONVERSION_CACHE) > _CONVERSION_CACHE_SIZE:
+            _CONVERSION_CACHE.popitem(last=False)
+    return result
+
+
+convert_markdown_to_notion.cache_clear = _conversion_cache_clear
+
+
+@debug_trace()
+def markdown_batch_to_notion(texts: List[str]) -> List[Dict[str, Any]]:
+    """
+    Convert several markdown texts to Notion blocks with a single pandoc run.
+    
+    Each text is converted as its own document: batches containing bracketed
+    references or example list labels, which pandoc resolves document-wide,
+    are converted one text at a time instead.
+    
+    Args:
+        texts: Markdown texts to convert
+        
+    Returns:
+        List of dictionaries containing Notion blocks, one per input text
+    """
+    logger.debug("Converting markdown batch to Notion blocks")
+    return _default_filter().convert_strings(texts)
 
 
 @debug_trace()
@@ -214,31 +502,150 @@ def filter_markdown_to_notion(markdown: str) -> Dict[str, Any]:
     return convert_markdown_to_notion(markdown)
 
 
+def _convert_file(path: str) -> Dict[str, Any]:
+    """
+    Read a markdown file and convert it to Notion blocks.
+    
+    Module-level so it can be sent to worker processes.
+    
+    Args:
+        path: Path of the markdown file
+        
+    Returns:
+        Dictionary containing Notion blocks
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        return convert_markdown_to_notion(f.read())
+
+
+def _output_path(output_dir: str, input_path: str, input_root: str) -> str:
+    """Return the JSON output path for an input file, mirrored under output_dir."""
+    relative = os.path.relpath(os.path.abspath(input_path), input_root)
+    return os.path.join(output_dir, os.path.splitext(relative)[0] + '.json')
+
+
+def _output_paths(paths: List[str], output_dir: str) -> List[str]:
+    """
+    Return the JSON output path for each input file.
+    
+    Args:
+        paths: Input file paths
+        output_dir: Directory receiving one .json file per input, laid out
+            like the inputs relative to their common parent directory
+            
+    Returns:
+        One output path per input, in the same order
+    """
+    input_root = os.path.commonpath([os.path.dirname(os.path.abspath(path)) for path in paths])
+    return [_output_path(output_dir, path, input_root) for path in paths]
+
+
+def _output_collision(paths: List[str], output_paths: List[str]) -> Optional[str]:
+    """
+    Describe the first output file that more than one input would write.
+    
+    Inputs differing only in their extension (a.md, a.markdown) or given
+    twice map to the same .json file, and the later result would silently
+    replace the earlier one.
+    
+    Args:
+        paths: Input file paths
+        output_paths: Output path of each input, as returned by _output_paths
+        
+    Returns:
+        An error message, or None if every input has its own output file
+    """
+    seen = {}
+    for path, output_path in zip(paths, output_paths):
+        key = os.path.normcase(os.path.abspath(output_path))
+        if key in seen:
+            return f"{seen[key]} and {path} would both be written to {output_path}"
+        seen[key] = path
+    return None
+
+
+def _stdout_writer():
+    """
+    Return a binary writer for stdout with a large buffer.
+    
+    Falls back to sys.stdout.buffer when stdout has no real file descriptor,
+    e.g. when it has been replaced in tests.
+    """
+    try:
+        raw = io.FileIO(sys.stdout.fileno(), 'wb', closefd=False)
+    except (AttributeError, ValueError, io.UnsupportedOperation):
+        return sys.stdout.buffer
+    return io.BufferedWriter(raw, buffer_size=1 << 20)
+
+
+def _write_outputs(paths: List[str], results: Iterable[Dict[str, Any]], output_paths: List[str]) -> None:
+    """
+    Write each conversion result to its own JSON file.
+    
+    Args:
+        paths: Input file paths, in the same order as results
+        results: Converted Notion blocks for each input
+        output_paths: Output file of each input, as returned by _output_paths
+    """
+    for path, notion_blocks, output_path in zip(paths, results, output_paths):
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        logger.debug("Writing %s to %s", path, output_path)
+        with open(output_path, 'wb') as f:
+            _json.dump(notion_blocks, f, indent=True)
+
+
 def main():
     """Command-line entry point."""
     import argparse
+    from concurrent.futures import ProcessPoolExecutor
     
     # Configure logging
     logging_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     logging.basicConfig(level=logging.INFO, format=logging_format)
     
     parser = argparse.ArgumentParser(description='Convert markdown to Notion blocks')
-    parser.add_argument('input', nargs='?', help='Input markdown file (omit for stdin)')
-    parser.add_argument('-o', '--output', help='Output file (default: stdout)')
+    parser.add_argument('input', nargs='*', help='Input markdown file(s) (omit for stdin)')
+    parser.add_argument('-o', '--output',
+                        help='Output file (default: stdout); with several inputs, an output directory')
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count(),
+                        help='Worker processes used for several inputs (default: CPU count)')
     parser.add_argument('-v', '--verbose', action='store_true', help='Enable verbose output')
     
     args = parser.parse_args()
     
+    if len(args.input) > 1 and not args.output:
+        parser.error('an output directory (-o) is required with several inputs')
+    
+    if len(args.input) > 1:
+        output_paths = _output_paths(args.input, args.output)
+        collision = _output_collision(args.input, output_paths)
+        if collision:
+            parser.error(collision)
+    
     # Set logging level
     if args.verbose:
         logger.setLevel(logging.DEBUG)
         logger.debug("Verbose logging enabled")
     
     try:
+        if len(args.input) > 1:
+            logger.info("Converting %d files into %s", len(args.input), args.output)
+            
+            # Each worker runs its own pandoc conversions, so independent
+            # files are converted in parallel
+            jobs = max(1, min(args.jobs or 1, len(args.input)))
+            if jobs == 1:
+                _write_outputs(args.input, map(_convert_file, args.input), output_paths)
+            else:
+                with ProcessPoolExecutor(max_workers=jobs) as executor:
+                    results = executor.map(_convert_file, args.input)
+                    _write_outputs(args.input, results, output_paths)
+            return
+        
         # Read input
         if args.input:
-            logger.info(f"Reading from file: {args.input}")
-            with open(args.input, 'r', encoding='utf-8') as f:
+            logger.info("Reading from file: %s", args.input[0])
+            with open(args.input[0], 'r', encoding='utf-8') as f:
                 markdown = f.read()
         else:
             logger.info("Reading from stdin")
@@ -248,18 +655,21 @@ def main():
         logger.debug("Starting conversion")
         notion_blocks = convert_markdown_to_notion(markdown)
         
-        # Output
-        output_json = json.dumps(notion_blocks, indent=2)
+        # Output, streamed so the whole JSON text is never held in memory
         if args.output:
-            logger.info(f"Writing to file: {args.output}")
-            with open(args.output, 'w', encoding='utf-8') as f:
-                f.write(output_json)
+            logger.info("Writing to file: %s", args.output)
+            with open(args.output, 'wb') as f:
+                _json.dump(notion_blocks, f, indent=True)
         else:
             logger.debug("Writing to stdout")
-            print(output_json)
+            sys.stdout.flush()
+            out = _stdout_writer()
+            _json.dump(notion_blocks, out, indent=True)
+            out.write(b"\n")
+            out.flush()
             
     except Exception as e:
-        logger.error(f"Error: {str(e)}", exc_info=True)
+        logger.error("Error: %s", e, exc_info=True)
         sys.exit(1)
 
 
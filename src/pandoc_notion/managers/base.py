@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Type, TypeVar
+from typing import Any, Dict, List, Tuple, TypeVar
 
 import panflute as pf
 
@@ -14,8 +14,31 @@ class Manager(ABC):
     
     Managers are responsible for converting panflute elements to Notion blocks or components.
     Each specific element type (paragraph, heading, code, etc.) should have its own manager.
+    
+    Managers list the panflute classes they convert in HANDLES, which the
+    default can_convert tests against. Managers whose accepted elements cannot
+    be expressed as a fixed set of types override can_convert instead.
     """
     
+    HANDLES: Tuple[type, ...] = ()
+    
+    @classmethod
+    def can_convert(cls, elem: pf.Element) -> bool:
+        """
+        Check if this manager can convert the given element.
+        
+        By default, accepts instances of the classes in HANDLES. Overrides
+        must decide on the element's type alone, since lookups are cached
+        per element type.
+        
+        Args:
+            elem: A panflute element
+            
+        Returns:
+            True if this manager can convert the element, False otherwise
+        """
+        return isinstance(elem, cls.HANDLES)
+    
     @classmethod
     @abstractmethod
     def convert(cls, elem: pf.Element) -> List[Block]:
@@ -35,22 +58,25 @@ class Manager(ABC):
         pass
         
     @classmethod
-    @abstractmethod
-    def to_dict(cls, elem: pf.Element) -> List[Dict[str, Any]]:
+    def _convert_unchecked(cls, elem: pf.Element) -> List[Block]:
         """
-        Convert a panflute element to Notion API-level blocks.
+        Convert an element already known to satisfy can_convert.
         
-        This public method must return objects at the Notion API abstraction level,
-        where each block (including list items) is represented at the API level.
-        Always returns a list, even if it contains only a single block.
+        Dispatchers that have checked can_convert call this instead of
+        convert. Managers whose convert re-validates the element type can
+        override it to skip that check; the default simply calls convert.
         
         Args:
-            elem: A panflute element
+            elem: A panflute element accepted by can_convert
             
         Returns:
-            A list of Notion API blocks (List[Dict[str, Any]])
+            A list of Notion Block objects (List[Block])
         """
-        pass
+        return cls.convert(elem)
+    
+    @classmethod
+    @abstractmethod
+    def to_dict(cls, elem: pf.Element) -> List[Dict[str, Any]]:
         """
         Convert a panflute element to Notion API-level blocks.
         
@@ -65,21 +91,3 @@ class Manager(ABC):
             A list of Notion API blocks (List[Dict[str, Any]])
         """
         pass
-    
-    @classmethod
-    def find_converter(cls, elem: pf.Element, managers: List[Type['Manager']]) -> Optional[Type['Manager']]:
-        """
-        Find the appropriate manager to convert a given element.
-        
-        Args:
-            elem: A panflute element
-            managers: A list of manager classes to search through
-            
-        Returns:
-            The first manager class that can convert the element, or None if none can
-        """
-        for manager in managers:
-            if manager.can_convert(elem):
-                return manager
-        return None
-
@@ -6,7 +6,7 @@ from pandoc_notion.models.code import Code
 from pandoc_notion.managers.base import Manager
 
 # Import debug_trace for detailed diagnostics
-from python_debug import debug_trace
+from pandoc_notion.debug import debug_trace
 
 
 class CodeManager(Manager):
@@ -16,6 +16,8 @@ class CodeManager(Manager):
     Handles language mapping from pandoc to Notion's supported languages.
     """
     
+    HANDLES = (pf.CodeBlock,)
+    
     # Map from pandoc language identifiers to Notion language identifiers
     # Based on Notion's supported languages as of 2023
     LANGUAGE_MAP = {
@@ -109,12 +111,6 @@ class CodeManager(Manager):
         "txt": "plain text"
     }
     
-    @classmethod
-    # Removed @debug_decorator
-    def can_convert(cls, elem: pf.Element) -> bool:
-        """Check if the element is a code block that can be converted."""
-        return isinstance(elem, pf.CodeBlock)
-    
     @classmethod
     @debug_trace()
     def convert(cls, elem: pf.Element) -> List[Code]:
@@ -178,11 +174,15 @@ class CodeManager(Manager):
         if not language:
             return "plain text"
         
-        # Convert to lowercase for case-insensitive matching
-        language_lower = language.lower()
+        # Pandoc usually emits lowercase identifiers already, so try an exact
+        # match before paying for a lowercased copy
+        language_map = cls.LANGUAGE_MAP
+        mapped = language_map.get(language)
+        if mapped is not None:
+            return mapped
         
-        # Try to find a match in our language map
-        return cls.LANGUAGE_MAP.get(language_lower, "plain text")
+        # Convert to lowercase for case-insensitive matching
+        return language_map.get(language.lower(), "plain text")
     
     @classmethod
     def create_code_block(cls, code: str, language: str = "plain text", caption: Optional[str] = None) -> Code:
@@ -199,4 +199,3 @@ class CodeManager(Manager):
         """
         mapped_language = cls._map_language(language)
         return Code(code, mapped_language, caption)
-
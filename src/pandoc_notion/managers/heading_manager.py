@@ -1,4 +1,4 @@
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, List
 
 import panflute as pf
 
@@ -8,7 +8,7 @@ from pandoc_notion.managers.base import Manager
 from pandoc_notion.managers.text_manager import TextManager
 
 # Import debug_trace for detailed diagnostics
-from python_debug import debug_trace
+from pandoc_notion.debug import debug_trace
 
 
 class HeadingManager(Manager):
@@ -19,14 +19,9 @@ class HeadingManager(Manager):
     respecting that Notion only supports h1, h2, and h3.
     """
     
-    @classmethod
-    # Removed @debug_decorator
-    def can_convert(cls, elem: pf.Element) -> bool:
-        """Check if the element is a header that can be converted."""
-        return isinstance(elem, pf.Header)
+    HANDLES = (pf.Header,)
     
     @classmethod
-    # Removed @debug_decorator
     @debug_trace()
     def convert(cls, elem: pf.Element) -> List[Heading]:
         """
@@ -41,6 +36,11 @@ class HeadingManager(Manager):
         if not isinstance(elem, pf.Header):
             raise ValueError(f"Expected Header element, got {type(elem).__name__}")
         
+        return cls._convert_unchecked(elem)
+    
+    @classmethod
+    def _convert_unchecked(cls, elem: pf.Header) -> List[Heading]:
+        """Convert a header without re-checking its type; see convert."""
         # Get the heading level (Notion supports h1, h2, h3)
         # Any deeper levels will be mapped to h3
         level = elem.level
@@ -49,14 +49,42 @@ class HeadingManager(Manager):
         heading = Heading(level)
         
         # Use TextManager to convert all inline elements in the heading
-        texts = TextManager.create_text_elements(list(elem.content))
+        texts = TextManager.create_text_elements(elem.content)
         heading.add_texts(texts)
         
         # Return as a single-item list
         return [heading]
     
     @classmethod
-    # Removed @debug_decorator
+    def convert_many(cls, elems: Iterable[pf.Element]) -> List[Heading]:
+        """
+        Convert several panflute header elements to Notion Heading block objects.
+        
+        Equivalent to calling convert on each header, without paying the
+        per-call type check and attribute lookups. Elements that are not
+        headers are skipped.
+        
+        Args:
+            elems: Panflute elements, typically Header elements
+            
+        Returns:
+            A list with one Heading block object per header, in input order
+        """
+        heading_cls = Heading
+        header_cls = pf.Header
+        create_text_elements = TextManager.create_text_elements
+        
+        headings = []
+        append = headings.append
+        for elem in elems:
+            if not isinstance(elem, header_cls):
+                continue
+            heading = heading_cls(elem.level)
+            heading.add_texts(create_text_elements(elem.content))
+            append(heading)
+        return headings
+    
+    @classmethod
     @debug_trace()
     def to_dict(cls, elem: pf.Element) -> List[Dict[str, Any]]:
         """
@@ -68,9 +96,8 @@ class HeadingManager(Manager):
         Returns:
             A list containing a single heading block dictionary in Notion API format
         """
-        # Convert to Heading objects, then convert each to dictionary
-        headings = cls.convert(elem)
-        return [heading.to_dict() for heading in headings]
+        # convert always yields exactly one heading
+        return [cls.convert(elem)[0].to_dict()]
     
     @classmethod
     def convert_plain_text(cls, text: str, level: int = 1) -> List[Heading]:
@@ -100,6 +127,4 @@ class HeadingManager(Manager):
         Returns:
             A list containing a single heading block dictionary in Notion API format
         """
-        headings = cls.convert_plain_text(text, level)
-        return [heading.to_dict() for heading in headings]
-
+        return [cls.convert_plain_text(text, level)[0].to_dict()]
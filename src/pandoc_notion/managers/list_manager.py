@@ -1,15 +1,80 @@
-from typing import List as PyList, Union, Dict, Any, Optional, Type
+from __future__ import annotations
+
+import sys
+from itertools import islice
+from typing import TYPE_CHECKING
 
 import panflute as pf
 
-from pandoc_notion.models.list import List, ListItem, create_bulleted_list, create_numbered_list, create_todo_list, create_todo_item
-from pandoc_notion.models.text import Text
+from pandoc_notion.models.list import List, ListItem, create_bulleted_list, create_numbered_list, create_todo_list, create_todo_item, create_list_item_from_text
 from pandoc_notion.managers.base import Manager
 from pandoc_notion.managers.text_manager import TextManager
 from pandoc_notion.managers.paragraph_manager import ParagraphManager
 
 # Import debug_trace for detailed diagnostics
-from python_debug import debug_trace
+from pandoc_notion.debug import debug_trace
+
+# Bound once; looked up for every block of inline content
+_CREATE_TEXTS = TextManager.create_text_elements
+
+# Unicode characters for unchecked and checked boxes
+_CHECKBOX_CHARS = frozenset(("☐", "☒"))
+
+# Item types handed to ListItem, interned so comparisons against them are identity checks
+_BULLETED = sys.intern("bulleted")
+_NUMBERED = sys.intern("numbered")
+_TODO = sys.intern("todo")
+
+# Shared stand-in for a missing collection argument
+_EMPTY: tuple = ()
+
+
+if TYPE_CHECKING:
+    # Annotations are not evaluated at runtime, so typing is only needed here
+    from typing import List as PyList, Union, Dict, Any, Optional, Tuple, Type
+    
+    # Worklist of (panflute list, Notion List to fill, item type) still to convert
+    _Pending = PyList[Tuple[Union[pf.BulletList, pf.OrderedList], List, str]]
+
+
+def _add_plain_child(manager: Type['ListManager'], list_item: ListItem, child: pf.Plain,
+                     pending: Optional[_Pending]) -> None:
+    """Add the text of a Plain element, the standard text container of a list item."""
+    # Extract text content from the Plain element, preserving all formatting
+    texts = _CREATE_TEXTS(child.content)
+    list_item.add_texts(texts)
+
+
+def _add_nested_list_child(manager: Type['ListManager'], list_item: ListItem,
+                           child: Union[pf.BulletList, pf.OrderedList],
+                           pending: Optional[_Pending]) -> None:
+    """
+    Add a nested bullet or ordered list as a child of the list item.
+    
+    With a worklist, the nested list is attached empty and its items are
+    converted when it is popped; otherwise it is converted right away.
+    """
+    if pending is None:
+        list_item.add_child(manager._convert_one(child))
+        return
+    factory, parent_type = _LIST_FACTORIES[type(child)]
+    nested = factory()
+    list_item.add_child(nested)
+    pending.append((child, nested, parent_type))
+
+
+# Notion List factory and item type for each panflute list type
+_LIST_FACTORIES = {
+    pf.BulletList: (create_bulleted_list, _BULLETED),
+    pf.OrderedList: (create_numbered_list, _NUMBERED),
+}
+
+# Handlers for the children of a list item, keyed by exact element type
+_CHILD_DISPATCH = {
+    pf.Plain: _add_plain_child,
+    pf.BulletList: _add_nested_list_child,
+    pf.OrderedList: _add_nested_list_child,
+}
 
 
 class ListManager(Manager):
@@ -21,14 +86,9 @@ class ListManager(Manager):
     todo items can appear alongside regular list items.
     """
     
-    @classmethod
-    # Removed @debug_decorator
-    def can_convert(cls, elem: pf.Element) -> bool:
-        """Check if the element is a list that can be converted."""
-        return isinstance(elem, (pf.BulletList, pf.OrderedList))
+    HANDLES = (pf.BulletList, pf.OrderedList)
     
     @classmethod
-    # Removed @debug_decorator
     @debug_trace()
     def convert(cls, elem: pf.Element) -> PyList[List]:
         """
@@ -43,15 +103,9 @@ class ListManager(Manager):
         Returns:
             A list containing a single Notion List object
         """
-        if isinstance(elem, pf.BulletList):
-            return [cls._convert_bullet_list(elem)]
-        elif isinstance(elem, pf.OrderedList):
-            return [cls._convert_ordered_list(elem)]
-        else:
-            raise ValueError(f"Expected BulletList or OrderedList element, got {type(elem).__name__}")
+        return [cls._convert_one(elem)]
     
     @classmethod
-    # Removed @debug_decorator
     @debug_trace()
     def to_dict(cls, elem: pf.Element) -> PyList[Dict[str, Any]]:
         """
@@ -65,16 +119,26 @@ class ListManager(Manager):
         Returns:
             A list of Notion API-level blocks
         """
-        # Get the single List object using convert
-        # convert() now returns a list, so take the first element
-        list_objs = cls.convert(elem)
-        if not list_objs:
-            return [] # Should not happen if can_convert passed, but handle defensively
-        list_obj = list_objs[0]
-            
-        # Convert the List object to API-level dictionaries
         # The List.to_dict() method returns the flat list of item blocks.
-        return list_obj.to_dict()
+        return cls._convert_one(elem).to_dict()
+
+    @classmethod
+    def _convert_one(cls, elem: pf.Element) -> List:
+        """
+        Convert a panflute list element to a single Notion List object.
+
+        Args:
+            elem: A panflute BulletList or OrderedList element
+
+        Returns:
+            The Notion List object holding all converted items
+        """
+        if isinstance(elem, pf.BulletList):
+            return cls._convert_bullet_list(elem)
+        elif isinstance(elem, pf.OrderedList):
+            return cls._convert_ordered_list(elem)
+        else:
+            raise ValueError(f"Expected BulletList or OrderedList element, got {type(elem).__name__}")
 
     @classmethod
     @debug_trace()
@@ -91,15 +155,9 @@ class ListManager(Manager):
         Returns:
             A single Notion List object containing all items.
         """
-        notion_items = []
-        
-        for item in elem.content:
-            # Convert each panflute ListItem to a Notion ListItem
-            notion_item = cls._convert_list_item(item, "bulleted")
-            notion_items.append(notion_item)
-            
-        # Create a single List container holding all collected items
-        return create_bulleted_list(notion_items)
+        # Convert each panflute ListItem to a Notion ListItem and create a
+        # single List container holding all of them
+        return cls._populate(elem, create_bulleted_list(), _BULLETED)
 
     @classmethod
     @debug_trace()
@@ -113,67 +171,42 @@ class ListManager(Manager):
         Returns:
             A single Notion List object containing all items.
         """
-        notion_items = []
-        
         # Handle list attributes if needed (start number, etc.)
         # As of now, Notion doesn't support custom numbering for lists
         # so we ignore start, style, and delimiter attributes
         
-        for item in elem.content:
-            # Convert each panflute ListItem to a Notion ListItem
-            notion_item = cls._convert_list_item(item, "numbered")
-            notion_items.append(notion_item)
-            
-        # Create a single List container holding all collected items
-        return create_numbered_list(notion_items)
+        # Convert each panflute ListItem to a Notion ListItem and create a
+        # single List container holding all of them
+        return cls._populate(elem, create_numbered_list(), _NUMBERED)
 
     @classmethod
-    def _is_checkbox(cls, text: str) -> bool:
-        """
-        Check if the text starts with a checkbox character.
-        
-        Args:
-            text: Text to check
-            
-        Returns:
-            True if the text starts with a checkbox character, False otherwise
+    def _populate(cls, elem: Union[pf.BulletList, pf.OrderedList], list_obj: List,
+                  parent_type: str) -> List:
         """
-        # Unicode characters for checked and unchecked boxes
-        return text.startswith("☐") or text.startswith("☒")
-    
-    @classmethod
-    def _is_checked_checkbox(cls, text: str) -> bool:
-        """
-        Check if the text starts with a checked checkbox character.
-        
-        Args:
-            text: Text to check
-            
-        Returns:
-            True if the text starts with a checked checkbox character, False otherwise
-        """
-        # Only the checked box character
-        return text.startswith("☒")
-    
-    @classmethod
-    def _strip_checkbox(cls, text: str) -> str:
-        """
-        Remove checkbox character from the beginning of text.
-        
+        Fill a Notion List with the converted items of a panflute list.
+
+        Nested lists are converted from an explicit worklist instead of by
+        recursion, so deep nesting adds no call frames.
+
         Args:
-            text: Text with possible checkbox prefix
-            
+            elem: A panflute BulletList or OrderedList element
+            list_obj: The empty Notion List to fill
+            parent_type: The item type for elem's items ("bulleted" or "numbered")
+
         Returns:
-            Text with checkbox removed if present
+            list_obj, holding all items
         """
-        if cls._is_checkbox(text):
-            # Remove checkbox and optional space after it
-            return text[1:].lstrip()
-        return text
-    
+        pending = [(elem, list_obj, parent_type)]
+        while pending:
+            pf_list, notion_list, item_type = pending.pop()
+            for item in pf_list.content:
+                notion_list.add_item(cls._convert_list_item(item, item_type, pending))
+        return list_obj
+
     @classmethod
     @debug_trace()
-    def _convert_list_item(cls, elem: pf.ListItem, parent_type: str = "bulleted") -> ListItem:
+    def _convert_list_item(cls, elem: pf.ListItem, parent_type: str = _BULLETED,
+                           pending: Optional[_Pending] = None) -> ListItem:
         """
         Convert a panflute ListItem to a Notion ListItem.
         
@@ -187,51 +220,52 @@ class ListManager(Manager):
         Args:
             elem: A panflute ListItem element
             parent_type: The type of the parent list ("bulleted" or "numbered")
+            pending: Worklist that receives nested lists to convert later; when
+                None, nested lists are converted immediately
             
         Returns:
             A Notion ListItem object with appropriate type and checked status
         """
         is_todo_item = False
         is_checked = False
+        # Inline content of the first Plain with the checkbox removed, if any
+        first_inlines = None
+        content = elem.content
         
         # Check if the first element is a Plain with a checkbox
-        if elem.content and isinstance(elem.content[0], pf.Plain):
-            first_plain = elem.content[0]
-            # Check if the first element in the Plain is a Str with a checkbox
-            if first_plain.content and isinstance(first_plain.content[0], pf.Str):
-                first_str = first_plain.content[0]
-                if cls._is_checkbox(first_str.text):
-                    is_todo_item = True
-                    is_checked = cls._is_checked_checkbox(first_str.text)
-                    # Modify the first Str to remove the checkbox
-                    first_str.text = cls._strip_checkbox(first_str.text)
-                    # Remove the Space element that follows the checkbox character if it exists
-                    if len(first_plain.content) > 1 and isinstance(first_plain.content[1], pf.Space):
-                        first_plain.content.pop(1)
+        if content and isinstance(content[0], pf.Plain):
+            inlines = content[0].content
+            first_str = inlines[0] if inlines else None
+            # Most items have no checkbox, so test the first character before anything else
+            if isinstance(first_str, pf.Str) and first_str.text[:1] in _CHECKBOX_CHARS:
+                text = first_str.text
+                is_todo_item = True
+                is_checked = text[0] == "☒"
+                # Replace the first Str with a checkbox-free copy and skip the Space
+                # that follows it, leaving the input AST untouched
+                skip = 2 if len(inlines) > 1 and type(inlines[1]) is pf.Space else 1
+                first_inlines = [pf.Str(text[1:].lstrip()), *islice(inlines, skip, None)]
 
         # Create list item with the appropriate type
-        item_type = "todo" if is_todo_item else parent_type
+        item_type = _TODO if is_todo_item else parent_type
         list_item = ListItem(item_type=item_type, checked=is_checked)
         
-        # Process the content of the list item
-        for child in elem.content:
-            # Handle Plain elements - these are the standard containers for text in list items in the panflute AST
-            if isinstance(child, pf.Plain):
-                # Extract text content from the Plain element, preserving all formatting
-                texts = TextManager.create_text_elements(child.content)
-                list_item.add_texts(texts)
-            # Handle nested bullet lists
-            elif isinstance(child, pf.BulletList):
-                # Process nested bullet list
-                nested_list_obj_list = cls.convert(child) # convert returns a list
-                if nested_list_obj_list:
-                    list_item.add_child(nested_list_obj_list[0]) # Add the single container
-            # Handle nested ordered lists
-            elif isinstance(child, pf.OrderedList):
-                # Process nested ordered list
-                nested_list_obj_list = cls.convert(child) # convert returns a list
-                if nested_list_obj_list:
-                    list_item.add_child(nested_list_obj_list[0]) # Add the single container
+        # Common case: the item is a single Plain with no nested lists
+        if len(content) == 1 and type(content[0]) is pf.Plain:
+            list_item.add_texts(_CREATE_TEXTS(content[0].content if first_inlines is None else first_inlines))
+            return list_item
+        
+        children = iter(content)
+        if first_inlines is not None:
+            # The first Plain was already read into first_inlines
+            next(children)
+            list_item.add_texts(_CREATE_TEXTS(first_inlines))
+        
+        # Process the content of the list item; other child types are ignored
+        for child in children:
+            handler = _CHILD_DISPATCH.get(type(child))
+            if handler is not None:
+                handler(cls, list_item, child, pending)
 
         return list_item
 
@@ -246,14 +280,7 @@ class ListManager(Manager):
         Returns:
             A Notion bulleted List object
         """
-        bullet_list = create_bulleted_list()
-        
-        for text_str in texts:
-            item = ListItem()
-            item.add_text(Text(text_str))
-            bullet_list.add_item(item)
-        
-        return bullet_list
+        return create_bulleted_list([create_list_item_from_text(text_str) for text_str in texts])
     
     @classmethod
     def create_numbered_list_from_texts(cls, texts: PyList[str]) -> List:
@@ -266,14 +293,7 @@ class ListManager(Manager):
         Returns:
             A Notion numbered List object
         """
-        numbered_list = create_numbered_list()
-        
-        for text_str in texts:
-            item = ListItem()
-            item.add_text(Text(text_str))
-            numbered_list.add_item(item)
-        
-        return numbered_list
+        return create_numbered_list([create_list_item_from_text(text_str) for text_str in texts])
     
     @classmethod
     def create_todo_list_from_texts(cls, texts: PyList[str], checked_indices: PyList[int] = None) -> List:
@@ -287,13 +307,9 @@ class ListManager(Manager):
         Returns:
             A Notion todo List object
         """
-        todo_list = create_todo_list()
-        checked_indices = checked_indices or []
-        
-        for i, text_str in enumerate(texts):
-            checked = i in checked_indices
-            item = create_todo_item(text_str, checked)
-            todo_list.add_item(item)
-        
-        return todo_list
-
+        # Set membership keeps this linear in the number of texts
+        checked_set = frozenset(checked_indices) if checked_indices else _EMPTY
+        return create_todo_list([
+            create_todo_item(text_str, i in checked_set)
+            for i, text_str in enumerate(texts)
+        ])
@@ -1,4 +1,6 @@
-from typing import List, Dict, Any
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 
 import panflute as pf
 
@@ -9,7 +11,47 @@ from pandoc_notion.managers.text_manager import TextManager
 from pandoc_notion.managers.registry_mixin import RegistryMixin
 
 # Import debug_trace for detailed diagnostics
-from python_debug import debug_trace
+from pandoc_notion.debug import debug_trace
+
+# Bound once so type checks skip the module attribute lookup
+_PARA = pf.Para
+_STR = pf.Str
+_SPACE = pf.Space
+
+if TYPE_CHECKING:
+    # Annotations are not evaluated at runtime, so typing is only needed here
+    from typing import List, Dict, Any, Sequence
+
+# Bound once; looked up for every block of inline content
+_CREATE_TEXTS = TextManager.create_text_elements
+
+
+def _inline_texts(content: Sequence[pf.Element]) -> List[Text]:
+    """
+    Convert a paragraph's inline content to text elements.
+    
+    Content made only of Str and Space elements, the most common kind, becomes
+    a single unformatted Text without going through TextManager; the result
+    is the same as create_text_elements would produce.
+    
+    Args:
+        content: The inline elements of a paragraph; a sequence, since other
+            content is scanned once and then passed to TextManager
+        
+    Returns:
+        A list of Notion inline elements
+    """
+    parts = []
+    for inline in content:
+        inline_type = type(inline)
+        if inline_type is _STR:
+            parts.append(inline.text)
+        elif inline_type is _SPACE:
+            parts.append(" ")
+        else:
+            return _CREATE_TEXTS(content)
+    text = "".join(parts)
+    return [Text(text)] if text else []
 
 
 class ParagraphManager(Manager, RegistryMixin):
@@ -19,14 +61,9 @@ class ParagraphManager(Manager, RegistryMixin):
     Paragraphs are one of the most common block types in documents.
     """
     
-    @classmethod
-    # Removed @debug_decorator
-    def can_convert(cls, elem: pf.Element) -> bool:
-        """Check if the element is a paragraph that can be converted."""
-        return isinstance(elem, pf.Para)
+    HANDLES = (pf.Para,)
     
     @classmethod
-    # Removed @debug_decorator
     @debug_trace()
     def convert(cls, elem: pf.Element) -> List[Paragraph]:
         """
@@ -38,21 +75,15 @@ class ParagraphManager(Manager, RegistryMixin):
         Returns:
             A list containing a single Paragraph block object
         """
-        if not isinstance(elem, pf.Para):
-            raise ValueError(f"Expected Para element, got {type(elem).__name__}")
-        
-        # Create a new paragraph
-        paragraph = Paragraph()
-        
-        # Convert all inline elements together using TextManager directly
-        # This ensures all elements are processed as a batch
-        text_elements = TextManager.create_text_elements(list(elem.content))
-        for text_element in text_elements:
-            paragraph.add_text(text_element)
-        return [paragraph]
+        cls._validate(elem)
+        return [cls._build(elem)]
+    
+    @classmethod
+    def _convert_unchecked(cls, elem: pf.Para) -> List[Paragraph]:
+        """Convert a paragraph without re-checking its type; see convert."""
+        return [cls._build(elem)]
     
     @classmethod
-    # Removed @debug_decorator
     @debug_trace()
     def to_dict(cls, elem: pf.Element) -> List[Dict[str, Any]]:
         """
@@ -64,9 +95,55 @@ class ParagraphManager(Manager, RegistryMixin):
         Returns:
             A list containing a single paragraph block dictionary in Notion API format
         """
-        # Convert to Paragraph objects, then convert each to dictionary
-        paragraphs = cls.convert(elem)
-        return [paragraph.to_dict() for paragraph in paragraphs]
+        cls._validate(elem)
+        # Serialize straight from the text elements; no Paragraph is needed
+        return [Paragraph.dict_from_texts(cls._texts(elem))]
+    
+    @staticmethod
+    def _validate(elem: pf.Element) -> None:
+        """
+        Check that an element is a Para.
+        
+        Args:
+            elem: A panflute element
+            
+        Raises:
+            ValueError: If elem is not a Para element
+        """
+        if type(elem) is not _PARA and not isinstance(elem, _PARA):
+            raise ValueError(f"Expected Para element, got {type(elem).__name__}")
+    
+    @staticmethod
+    def _texts(elem: pf.Para) -> List[Text]:
+        """
+        Convert the inline content of an already validated Para element.
+        
+        Args:
+            elem: A panflute Para element
+            
+        Returns:
+            A list of Notion inline elements
+        """
+        return _inline_texts(elem.content)
+    
+    @classmethod
+    def _build(cls, elem: pf.Para) -> Paragraph:
+        """
+        Build the Paragraph block for an already validated Para element.
+        
+        Args:
+            elem: A panflute Para element
+            
+        Returns:
+            The Paragraph block object
+        """
+        # Create a new paragraph
+        paragraph = Paragraph()
+        
+        # Convert all inline elements together using TextManager directly
+        # This ensures all elements are processed as a batch
+        paragraph.add_texts(cls._texts(elem))
+        return paragraph
     
     @classmethod
     def convert_plain_text(cls, text: str) -> List[Paragraph]:
@@ -84,7 +161,6 @@ class ParagraphManager(Manager, RegistryMixin):
         return [paragraph]
     
     @classmethod
-    # Removed @debug_decorator
     def convert_plain_text_to_dict(cls, text: str) -> List[Dict[str, Any]]:
         """
         Create a paragraph dictionary from plain text.
@@ -95,6 +171,4 @@ class ParagraphManager(Manager, RegistryMixin):
         Returns:
             A list containing a single paragraph block dictionary in Notion API format
         """
-        paragraphs = cls.convert_plain_text(text)
-        return [paragraph.to_dict() for paragraph in paragraphs]
-
+        return [cls.convert_plain_text(text)[0].to_dict()]
@@ -5,7 +5,9 @@ QuoteManager is responsible for converting Pandoc block quotes to Notion quote b
 handling rich text formatting and nested content correctly.
 """
 
-from typing import List as PyList, Dict, Any
+import logging
+from itertools import islice
+from typing import List as PyList, Dict, Any, Optional, Tuple
 
 import panflute as pf
 
@@ -17,7 +19,41 @@ from pandoc_notion.managers.registry_mixin import RegistryMixin
 from pandoc_notion.managers.text_manager import TextManager
 
 # Import debug_trace for detailed diagnostics
-from python_debug import debug_trace
+from pandoc_notion.debug import debug_trace
+
+logger = logging.getLogger('pandoc_notion.quote_manager')
+
+# Bound once so type checks skip the module attribute lookup
+_BLOCKQUOTE = pf.BlockQuote
+
+# Whether instances of a block type carry text_content, decided once per type
+_HAS_TEXT_CONTENT: Dict[type, bool] = {}
+
+
+def _has_text_content(block: Any) -> bool:
+    """Check for a text_content attribute, probing each block type only once."""
+    block_type = type(block)
+    flag = _HAS_TEXT_CONTENT.get(block_type)
+    if flag is None:
+        flag = _HAS_TEXT_CONTENT[block_type] = hasattr(block, 'text_content')
+    return flag
+
+
+def _add_single_block(quote: Quote, block: Any) -> None:
+    """Add one converted block, e.g. a NotionList or a manager's bare Block."""
+    quote.add_child(block)
+
+
+def _add_block_list(quote: Quote, blocks: PyList[Any]) -> None:
+    """Add a list of converted blocks, the typical result of convert_with_manager."""
+    quote.add_children(blocks)
+
+
+# Handlers for the shapes a converted result can take, keyed by exact type
+_ADD_BLOCKS = {
+    NotionList: _add_single_block,
+    list: _add_block_list,
+}
 
 
 class QuoteManager(Manager, RegistryMixin):
@@ -28,10 +64,7 @@ class QuoteManager(Manager, RegistryMixin):
     In Notion's structure, a blockquote can contain rich text and nested child blocks.
     """
     
-    @classmethod
-    def can_convert(cls, elem: pf.Element) -> bool:
-        """Check if the element is a block quote that can be converted."""
-        return isinstance(elem, pf.BlockQuote)
+    HANDLES = (pf.BlockQuote,)
     
     @classmethod
     @debug_trace()
@@ -50,32 +83,54 @@ class QuoteManager(Manager, RegistryMixin):
             A list containing a single Quote object,
             potentially with nested child blocks.
         """
-        if not isinstance(elem, pf.BlockQuote):
+        if type(elem) is not _BLOCKQUOTE and not isinstance(elem, _BLOCKQUOTE):
             raise ValueError(f"Expected BlockQuote element, got {type(elem).__name__}")
 
+        return cls._convert_unchecked(elem)
+    
+    @classmethod
+    def _convert_unchecked(cls, elem: pf.BlockQuote) -> PyList[Quote]:
+        """Convert a block quote without re-checking its type; see convert."""
         # Create a new quote
         quote = Quote()
+        
+        # Nested block quotes are filled from a worklist instead of by
+        # recursion, so deep nesting adds no call frames
+        pending = [(elem, quote)]
+        while pending:
+            block_quote, notion_quote = pending.pop()
+            cls._fill_quote(block_quote, notion_quote, pending)
 
+        return [quote]
+    
+    @classmethod
+    def _fill_quote(cls, elem: pf.BlockQuote, quote: Quote,
+                    pending: PyList[Tuple[pf.BlockQuote, Quote]]) -> None:
+        """
+        Fill a Quote with the text and child blocks of a panflute block quote.
+        
+        Args:
+            elem: A panflute BlockQuote element
+            quote: The empty Notion Quote object to fill
+            pending: Worklist that receives nested block quotes to fill later
+        """
+        content = elem.content
+        
         # Handle empty blockquote
-        if not elem.content:
-            return [quote]
+        if not content:
+            return
         
         # Process the first element to use as quote text
-        if elem.content:
-            first_elem = elem.content[0]
-            print(f"First element type: {type(first_elem).__name__}") # Debug print
-            cls._process_first_element(first_elem, quote)
+        cls._process_first_element(content[0], quote)
 
         # Process the rest of the elements as children
-        for content in elem.content[1:]:
-            cls._process_child_element(content, quote)
+        for child in islice(content, 1, None):
+            cls._process_child_element(child, quote, pending)
 
         # Check if the quote has any text content; add empty text if needed
         if not quote.text_content:
-            print("WARNING: Quote has no text content after processing, adding empty text.") # Debug print
+            logger.debug("Quote has no text content after processing, adding empty text")
             quote.add_text(Text(""))
-
-        return [quote]
     
     @classmethod
     @debug_trace()
@@ -87,54 +142,50 @@ class QuoteManager(Manager, RegistryMixin):
             elem: The first element in the blockquote
             quote: The Notion Quote object to update
         """
-        print(f"Processing first element type: {type(elem).__name__}") # Debug print
-        
         # Check if the element has inline content (like Para, Header, Plain)
         if hasattr(elem, 'content') and isinstance(elem.content, list):
-            print(f"Element content: {elem.content}") # Debug print
             # Use TextManager to extract rich text with formatting preserved
             text_elements = TextManager.create_text_elements(elem.content)
-            print(f"Extracted text elements: {text_elements}") # Debug print
             if text_elements:
                 quote.add_texts(text_elements)
                 return # Text successfully extracted and added
                 
         # If text couldn't be extracted directly, or element has no content list
-        print(f"Converting element using registry: {type(elem).__name__}") # Debug print
         converted = cls.convert_with_manager(elem)
-        print(f"Converted result type: {type(converted)}") # Debug print
         
         # Try to use the converted result's text content if available (e.g., if it was a Para)
         # Note: convert_with_manager returns a list, so check the first item
-        if converted and isinstance(converted, list) and len(converted) > 0 and hasattr(converted[0], 'text_content'):
-            print("Using text_content from first converted block.") # Debug print
+        if converted and isinstance(converted, list) and len(converted) > 0 and _has_text_content(converted[0]):
             quote.add_texts(converted[0].text_content)
         else:
             # Add the converted element(s) as child(ren) if text extraction failed
-            print("Adding converted element(s) as children instead.") # Debug print
             cls._add_converted_blocks_as_children(quote, converted)
     
     @classmethod
     @debug_trace()
-    def _process_child_element(cls, elem: pf.Element, quote: Quote) -> None:
+    def _process_child_element(cls, elem: pf.Element, quote: Quote,
+                               pending: Optional[PyList[Tuple[pf.BlockQuote, Quote]]] = None) -> None:
         """
         Process a subsequent element of a blockquote, adding it as a child block.
         
         Args:
             elem: A child element in the blockquote
             quote: The Notion Quote object to update
+            pending: Worklist that receives nested block quotes to fill later;
+                when None, nested block quotes are converted immediately
         """
-        print(f"Processing child element type: {type(elem).__name__}") # Debug print
-        
-        if isinstance(elem, pf.BlockQuote):
-            # Special handling for nested blockquotes - recursively convert
-            nested_quotes = cls.convert(elem) # Returns a list of Quote objects
-            for nested_quote in nested_quotes:
+        if type(elem) is _BLOCKQUOTE or isinstance(elem, _BLOCKQUOTE):
+            # Special handling for nested blockquotes
+            if pending is None:
+                for nested_quote in cls._convert_unchecked(elem):
+                    quote.add_child(nested_quote)
+            else:
+                nested_quote = Quote()
                 quote.add_child(nested_quote)
+                pending.append((elem, nested_quote))
         else:
             # Use the registry to find the appropriate manager and convert
             converted = cls.convert_with_manager(elem) # Returns a list or sometimes a single object
-            print(f"Converted child element result type: {type(converted)}") # Debug print
             cls._add_converted_blocks_as_children(quote, converted)
     
     @classmethod
@@ -147,33 +198,11 @@ class QuoteManager(Manager, RegistryMixin):
             quote: The Notion Quote object to add children to
             blocks: The converted blocks (can be None, single object, list, NotionList).
         """
-        print(f"Adding blocks as children, input type: {type(blocks)}") # Debug print
-        
         if not blocks:
-            print("No blocks to add (None or empty list)")
             return
-            
-        # Handle NotionList objects (model class, not directly iterable)
-        if isinstance(blocks, NotionList):
-            print("Adding NotionList as direct child")
-            quote.add_child(blocks)
-        # Handle single non-list blocks (e.g., if a manager returns a single Block)
-        # Check against list explicitly, as convert_with_manager usually returns a list
-        elif not isinstance(blocks, list): 
-             print(f"Adding single block of type: {type(blocks).__name__}")
-             quote.add_child(blocks)
-        # Handle list of blocks (typical case from convert_with_manager)
-        elif isinstance(blocks, list):
-            print(f"Adding {len(blocks)} blocks from list")
-            for block in blocks:
-                # A manager might still return a NotionList inside the Python list
-                if isinstance(block, NotionList): 
-                    print("Adding NotionList found inside list as direct child")
-                    quote.add_child(block)
-                else:
-                    quote.add_child(block)
-        else:
-             print(f"Warning: Unexpected type for blocks: {type(blocks)}")
+        
+        # Anything other than a Python list is a single block
+        _ADD_BLOCKS.get(type(blocks), _add_single_block)(quote, blocks)
 
     @classmethod
     def to_dict(cls, elem: pf.Element) -> PyList[Dict[str, Any]]:
@@ -187,9 +216,8 @@ class QuoteManager(Manager, RegistryMixin):
             A list containing a single dictionary representing the Notion API Quote block,
             potentially with nested child blocks.
         """
-        # Convert to Quote objects, then convert each to dictionary
-        quotes = cls.convert(elem)
-        return [quote.to_dict() for quote in quotes]
+        # convert always returns exactly one Quote
+        return [cls.convert(elem)[0].to_dict()]
     
     @classmethod
     def create_quote(cls, text: str) -> Quote:
@@ -218,7 +246,7 @@ class QuoteManager(Manager, RegistryMixin):
             A Notion Quote object
         """
         quote = Quote()
-        if hasattr(block, 'text_content'):
+        if _has_text_content(block):
             quote.add_texts(block.text_content)
         return quote
     
@@ -235,4 +263,3 @@ class QuoteManager(Manager, RegistryMixin):
         """
         quote = cls.create_quote(text)
         return quote.to_dict()
-
@@ -8,7 +8,7 @@ import panflute as pf
 
 from pandoc_notion.managers.base import Manager
 # Import debug_trace for detailed diagnostics
-from python_debug import debug_trace
+from pandoc_notion.debug import debug_trace
 
 # Shared registry instance
 _registry = None
@@ -27,6 +27,7 @@ class RegistryMixin:
         """Find a manager for the given element using the shared registry."""
         global _registry
         if _registry is not None:
+            # The registry caches its lookups per element type
             return _registry.find_manager(elem)
         print("Warning: Registry not set in RegistryMixin")
         return None
@@ -48,8 +49,8 @@ class RegistryMixin:
             return []
         
         try:
-            # The found manager's convert method should handle its own tracing if needed
-            return manager.convert(elem)
+            # find_manager has already checked can_convert for this element
+            return manager._convert_unchecked(elem)
         except (ValueError, TypeError) as e:
             # Expected exceptions during conversion - debug decorator will log them if applied
             print(f"Handled conversion error for {type(elem).__name__} with {manager.__name__}: {e}")
@@ -5,7 +5,7 @@ This module provides the TextManager class for converting Pandoc inline elements
 to Notion's rich text format, handling formatting, links, and special elements.
 """
 
-from typing import List, Optional, Tuple, Dict, Any, Set
+from typing import Iterable, List, Optional, Tuple, Dict, Any, Set
 
 import panflute as pf
 
@@ -18,11 +18,10 @@ from pandoc_notion.managers.text_manager_inline import (
     convert_code_element,
     convert_math_element
 )
-# Removed incorrect import: from ..utils.debug import debug_decorator
 from pandoc_notion.managers.base import Manager
 
 # Import debug_trace for detailed diagnostics
-from python_debug import debug_trace
+from pandoc_notion.debug import debug_trace
 
 
 class TextManager(Manager):
@@ -134,7 +133,6 @@ class TextManager(Manager):
         )
     
     @classmethod
-    # Removed @debug_decorator
     @debug_trace()
     def convert(cls, elements: List[pf.Element]) -> List[NotionInlineElement]:
         """
@@ -156,7 +154,7 @@ class TextManager(Manager):
     
     @classmethod
     @debug_trace()
-    def create_text_elements(cls, elements: List[pf.Element], 
+    def create_text_elements(cls, elements: Iterable[pf.Element], 
                    base_annotations: Optional[Annotations] = None) -> List[NotionInlineElement]:
         """
         Create Notion text elements from a list of panflute elements using stream processing.
@@ -165,7 +163,7 @@ class TextManager(Manager):
         when necessary (formatting changes or specialized element types).
         
         Args:
-            elements: A list of panflute elements
+            elements: Any iterable of panflute elements, e.g. an element's content
             base_annotations: Optional initial annotations to apply to all elements.
                              If None, default annotations will be used.
             
@@ -284,7 +282,6 @@ class TextManager(Manager):
         return merge_consecutive_texts(elements)
 
     @classmethod
-    # Removed @debug_decorator
     @debug_trace()
     def to_dict(cls, elements: List[pf.Element]) -> List[Dict[str, Any]]:
         """
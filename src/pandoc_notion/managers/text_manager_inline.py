@@ -153,6 +153,11 @@ class InlineElementConverter:
         """
         Register a handler function for a specific Pandoc element type.
         
+        Register handlers before the first conversion: registries cache which
+        manager accepts each element type, so a registry that has already
+        converted needs ManagerRegistry.clear_cache() to route the new type
+        to TextManager.
+        
         Args:
             elem_type: The Pandoc element type to register a handler for
             handler_func: Function that converts the element to a NotionInlineElement
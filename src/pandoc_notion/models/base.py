@@ -8,8 +8,13 @@ class Block(ABC):
     
     All specific block types (Paragraph, Heading, Code, etc.) should inherit from this class
     and implement the to_dict method to provide their specific Notion API representation.
+    
+    Subclasses that declare __slots__ for all of their attributes are stored
+    without a per-instance __dict__.
     """
     
+    __slots__ = ('block_type',)
+    
     def __init__(self, block_type: str):
         """
         Initialize a Block with a specific type.
@@ -29,25 +29,19 @@ class Code(Block):
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert the code block to a Notion API dictionary representation."""
-        # Create code content as Text object
+        # Create code content and optional caption as Text objects
         code_text = Text(self.code)
+        caption = [Text(self.caption).to_dict()] if self.caption else []
         
-        result = {
+        return {
             "object": "block",
             "type": self.block_type,
             "code": {
-                "caption": [],
+                "caption": caption,
                 "rich_text": [code_text.to_dict()],
                 "language": self.language
             }
         }
-        
-        # Add caption if provided using Text model
-        if self.caption:
-            caption_text = Text(self.caption)
-            result["code"]["caption"] = [caption_text.to_dict()]
-        
-        return result
     
     def __str__(self) -> str:
         """String representation of the code block for debugging."""
@@ -1,8 +1,12 @@
+import sys
 from typing import List, Dict, Any, Literal
 
 from pandoc_notion.models.base import Block
 from pandoc_notion.models.text import Text, merge_consecutive_texts
 
+# Interned heading block types, indexed by clamped level
+_HEADING_TYPES = (None,) + tuple(sys.intern(f"heading_{level}") for level in (1, 2, 3))
+
 
 class Heading(Block):
     """
@@ -15,6 +19,8 @@ class Heading(Block):
     # Type alias for heading levels
     HeadingLevel = Literal["heading_1", "heading_2", "heading_3"]
     
+    __slots__ = ('level', 'text_content')
+    
     def __init__(self, level: int, text_content: List[Text] = None):
         """
         Initialize a heading block.
@@ -26,9 +32,7 @@ class Heading(Block):
         # Convert level to Notion heading type ("heading_1", "heading_2", "heading_3")
         # Clamp level to range 1-3 since Notion only supports these levels
         clamped_level = min(max(level, 1), 3)
-        heading_type = f"heading_{clamped_level}"
-        
-        super().__init__(heading_type)
+        super().__init__(_HEADING_TYPES[clamped_level])
         self.level = clamped_level
         self.text_content = text_content or []
     
@@ -110,6 +110,13 @@ class List(Block):
     NUMBERED = "numbered_list_item"
     TODO = "to_do"
 
+    # Map the internal item_type ('bulleted', 'numbered', 'todo') to Notion's block type names
+    ITEM_TYPE_MAPPING = {
+        "bulleted": BULLETED,
+        "numbered": NUMBERED,
+        "todo": TODO
+    }
+
     # Type alias for list item types
     ListItemTypeInternal = Literal["bulleted", "numbered", "todo"]
     NotionListItemType = Literal["bulleted_list_item", "numbered_list_item", "to_do"]
@@ -162,14 +169,9 @@ class List(Block):
         respecting the specific type of each item (bulleted, numbered, or todo).
         """
         result = []
+        item_type_mapping = List.ITEM_TYPE_MAPPING
 
         for item in self.items:
-            # Map the internal item_type ('bulleted', 'numbered', 'todo') to Notion's block type names
-            item_type_mapping = {
-                "bulleted": List.BULLETED,
-                "numbered": List.NUMBERED,
-                "todo": List.TODO
-            }
             # Use item.item_type (e.g., "todo") to look up the Notion block type (e.g., "to_do")
             # Default to BULLETED if item.item_type is somehow invalid or missing
             notion_item_type = item_type_mapping.get(item.item_type, List.BULLETED)
@@ -42,12 +42,28 @@ class Paragraph(Block):
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert the paragraph to a Notion API dictionary representation."""
+        return self.dict_from_texts(self.text_content)
+    
+    @staticmethod
+    def dict_from_texts(texts: List[Text]) -> Dict[str, Any]:
+        """
+        Build the Notion API dictionary for a paragraph with the given content.
+        
+        Produces the same result as to_dict without needing a Paragraph
+        instance, for callers that only want the serialized block.
+        
+        Args:
+            texts: List of Text objects that make up the paragraph content
+            
+        Returns:
+            A paragraph block dictionary in Notion API format
+        """
         # Optimize by merging consecutive text objects with the same formatting
-        optimized_texts = merge_consecutive_texts(self.text_content)
+        optimized_texts = merge_consecutive_texts(texts)
         
         return {
             "object": "block",
-            "type": self.block_type,
+            "type": "paragraph",
             "paragraph": {
                 "rich_text": [text.to_dict() for text in optimized_texts],
                 "color": "default"
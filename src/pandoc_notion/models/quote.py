@@ -1,4 +1,4 @@
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterable
 
 from pandoc_notion.models.base import Block
 from pandoc_notion.models.text import Text, merge_consecutive_texts
@@ -53,6 +53,15 @@ class Quote(Block):
         """
         self.children.append(child)
     
+    def add_children(self, children: Iterable[Block]) -> None:
+        """
+        Add multiple child blocks to the quote.
+        
+        Args:
+            children: Block objects to add as children, in order
+        """
+        self.children.extend(children)
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert the quote to a Notion API dictionary representation."""
         # Optimize text content
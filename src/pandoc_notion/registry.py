@@ -1,4 +1,4 @@
-from typing import List, Type, Optional, Dict, Any, Union
+from typing import List, Type, Optional, Dict, Any, Union, Iterable
 import logging
 
 import panflute as pf
@@ -11,6 +11,10 @@ from pandoc_notion.managers.code_manager import CodeManager
 from pandoc_notion.managers.list_manager import ListManager
 from pandoc_notion.managers.quote_manager import QuoteManager
 from pandoc_notion.managers.registry_mixin import set_registry
+from pandoc_notion.models.base import Block
+
+# Configure module logger
+logger = logging.getLogger('pandoc_notion.registry')
 
 
 class ManagerRegistry:
@@ -30,7 +34,10 @@ class ManagerRegistry:
         """
         self.managers = managers or []
         
-        # Register default managers if none provided
+        # Manager lookups by element type; every can_convert decides on the
+        # element's type alone, so the answer can be reused per type
+        self._by_type: Dict[type, Optional[Type[Manager]]] = {}
+        
         # Register default managers if none provided
         if not self.managers:
             self.register_default_managers()
@@ -46,6 +53,17 @@ class ManagerRegistry:
         """
         if manager_class not in self.managers:
             self.managers.append(manager_class)
+            self.clear_cache()
+    
+    def clear_cache(self) -> None:
+        """
+        Forget the managers found per element type.
+        
+        register_manager calls this itself. Call it after changing what an
+        already registered manager accepts, e.g. after registering an inline
+        handler with InlineElementConverter.register once conversions have run.
+        """
+        self._by_type.clear()
     
     def register_default_managers(self) -> None:
         """Register all default managers."""
@@ -68,7 +86,8 @@ class ManagerRegistry:
         Find the appropriate manager for a given element.
         
         If multiple managers can handle the element, the first one is returned
-        based on the registration order.
+        based on the registration order. Results are cached per element type
+        and reset by clear_cache.
         
         Args:
             elem: A panflute element
@@ -76,10 +95,19 @@ class ManagerRegistry:
         Returns:
             A Manager class that can handle the element, or None if none found
         """
+        elem_type = type(elem)
+        try:
+            return self._by_type[elem_type]
+        except KeyError:
+            pass
+        
+        found = None
         for manager in self.managers:
             if manager.can_convert(elem):
-                return manager
-        return None
+                found = manager
+                break
+        self._by_type[elem_type] = found
+        return found
     
     def convert_element(self, elem: pf.Element) -> Any:
         """
@@ -98,7 +126,7 @@ class ManagerRegistry:
         if not manager:
             raise ValueError(f"No manager found for element type: {type(elem).__name__}")
         
-        return manager.convert(elem)
+        return manager._convert_unchecked(elem)
     
     def batch_convert(self, elements: List[pf.Element]) -> List[Any]:
         """
@@ -118,54 +146,73 @@ class ManagerRegistry:
             try:
                 manager = self.find_manager(elem)
                 if manager:
-                    converted = manager.convert(elem)
-                    if isinstance(converted, list):
+                    converted = manager._convert_unchecked(elem)
+                    if converted.__class__ is list:
                         result.extend(converted)
                     else:
                         result.append(converted)
             except Exception as e:
                 # Log the error but continue processing other elements
-                logging.error(f"Error converting element {type(elem).__name__}: {str(e)}")
+                logger.error("Error converting element %s: %s", type(elem).__name__, e)
         return result
         
-    def convert_elements_to_dicts(self, elements: List[pf.Element]) -> List[Dict[str, Any]]:
+    def convert_elements_to_dicts(self, elements: Iterable[pf.Element]) -> List[Dict[str, Any]]:
         """
-        Convert a list of elements to Notion block dictionaries.
+        Convert a sequence of elements to Notion block dictionaries.
         
         This method:
         1. Converts elements to Notion model objects using appropriate managers
         2. Converts model objects to dictionaries
-        3. Returns a list of JSON-serializable dictionaries
+        3. Returns a flat list of JSON-serializable dictionaries
+        
+        Models whose to_dict returns several blocks (such as lists) are
+        flattened, so every entry of the result is a block dictionary.
         
         Args:
-            elements: A list of panflute elements
+            elements: Any iterable of panflute elements, e.g. a Doc's content
             
         Returns:
             A list of Notion block dictionaries
         """
         blocks = []
+        # Bind the list methods once for the per-element loop
+        append = blocks.append
+        extend = blocks.extend
+        find_manager = self.find_manager
         
         for elem in elements:
             try:
-                manager = self.find_manager(elem)
+                manager = find_manager(elem)
                 if manager:
                     # Convert to model object(s)
-                    converted = manager.convert(elem)
+                    converted = manager._convert_unchecked(elem)
                     
-                    # Handle both single objects and lists
-                    models = converted if isinstance(converted, list) else [converted]
+                    # Handle both single objects and lists; exact class checks
+                    # are cheaper than isinstance in this per-element loop
+                    models = converted if converted.__class__ is list else (converted,)
                     
                     # Convert each model to dictionary
                     for model in models:
-                        if hasattr(model, 'to_dict'):
-                            blocks.append(model.to_dict())
+                        if isinstance(model, Block):
+                            block = model.to_dict()
+                            if block.__class__ is list:
+                                extend(block)
+                            else:
+                                append(block)
                         elif isinstance(model, dict):
-                            blocks.append(model)
+                            append(model)
+                        elif hasattr(model, 'to_dict'):
+                            # Duck-typed models from custom managers
+                            block = model.to_dict()
+                            if block.__class__ is list:
+                                extend(block)
+                            else:
+                                append(block)
                         else:
-                            logging.warning(f"Could not convert {type(model)} to dictionary")
+                            logger.warning("Could not convert %s to dictionary", type(model))
                             
             except Exception as e:
-                logging.error(f"Error converting element {type(elem).__name__}: {str(e)}")
+                logger.error("Error converting element %s: %s", type(elem).__name__, e)
         
         return blocks
     
@@ -291,3 +291,23 @@ def test_heading_with_special_characters(request):
         'notes': 'Headings support emoji characters in Notion'
     })
 
+
+def test_heading_convert_many_matches_convert():
+    """Test that batch conversion of headers matches converting them one at a time."""
+    elements = [
+        create_header("First", level=1),
+        pf.Para(pf.Str("Not a heading")),
+        create_formatted_header([("Bold", "bold"), ("plain", None)], level=2),
+        create_header("Deep", level=5),
+    ]
+    
+    batch = HeadingManager.convert_many(elements)
+    single = [
+        heading
+        for elem in elements if isinstance(elem, pf.Header)
+        for heading in HeadingManager.convert(elem)
+    ]
+    
+    assert len(batch) == 3
+    assert [h.to_dict() for h in batch] == [h.to_dict() for h in single]
+
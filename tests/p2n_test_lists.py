@@ -368,3 +368,31 @@ def test_numbered_list_with_todos(request):
         'notes': 'Numbered list with todo items mixed in'
     })
 
+
+
+def test_todo_list_from_texts_checked_indices():
+    """Test that create_todo_list_from_texts checks exactly the given indices."""
+    from pandoc_notion.managers.list_manager import ListManager
+    
+    todo_list = ListManager.create_todo_list_from_texts(["a", "b", "c", "d"], [3, 1, 1])
+    blocks = todo_list.to_dict()
+    
+    assert [block["to_do"]["checked"] for block in blocks] == [False, True, False, True]
+    validate_todo_item(blocks[1], "b", True)
+
+
+def test_todo_conversion_leaves_ast_unchanged():
+    """Test that converting a todo item does not strip the checkbox from the panflute AST."""
+    import panflute as pf
+    from pandoc_notion.managers.list_manager import ListManager
+    
+    plain = pf.Plain(pf.Str("☒"), pf.Space(), pf.Str("done"))
+    bullet_list = pf.BulletList(pf.ListItem(plain))
+    
+    first = ListManager.to_dict(bullet_list)
+    second = ListManager.to_dict(bullet_list)
+    
+    assert first == second
+    validate_todo_item(first[0], "done", True)
+    assert [type(inline) for inline in plain.content] == [pf.Str, pf.Space, pf.Str]
+    assert plain.content[0].text == "☒"
@@ -11,7 +11,7 @@ from pathlib import Path
 
 import pytest
 
-from pandoc_notion.filter import Filter, convert_markdown_to_notion
+from pandoc_notion.filter import Filter, convert_markdown_to_notion, markdown_batch_to_notion
 from pandoc_notion.models.base import Block
 
 
@@ -108,3 +108,112 @@ def test_helper_function_convert_markdown_to_notion():
     assert len(blocks) > 0
     assert all(isinstance(block, dict) and "type" in block for block in blocks)
 
+
+
+def test_markdown_batch_to_notion_matches_individual_conversions():
+    """Test that batch conversion returns the same blocks as converting each text alone."""
+    texts = [
+        "# Batch heading",
+        "Paragraph with **bold** text.",
+        "- First item\n- Second item",
+        "> A quoted line",
+        "",
+    ]
+    results = markdown_batch_to_notion(texts)
+    
+    assert len(results) == len(texts)
+    assert results == [convert_markdown_to_notion(text) for text in texts]
+
+
+def test_markdown_batch_to_notion_handles_swallowed_separator():
+    """Test that batch conversion falls back when an input swallows the separator."""
+    texts = ["```\nunterminated code fence", "Following snippet."]
+    results = markdown_batch_to_notion(texts)
+    
+    assert len(results) == len(texts)
+    assert results == [convert_markdown_to_notion(text) for text in texts]
+
+
+def test_markdown_batch_to_notion_keeps_definitions_per_input():
+    """Test that link definitions and footnotes do not leak between batch inputs."""
+    texts = ["see [docs][d]", "[d]: https://example.com", "note[^1]", "[^1]: the note"]
+    results = markdown_batch_to_notion(texts)
+    
+    assert results == [convert_markdown_to_notion(text) for text in texts]
+
+
+def test_markdown_batch_to_notion_keeps_headings_per_input():
+    """Test that implicit header references and example labels do not resolve across batch inputs."""
+    texts = ["# Intro", "See [Intro].", "(@good) An example.", "As in (@good)."]
+    results = markdown_batch_to_notion(texts)
+    
+    assert results == [convert_markdown_to_notion(text) for text in texts]
+
+
+def test_markdown_batch_to_notion_empty_input():
+    """Test that an empty batch returns an empty list."""
+    assert markdown_batch_to_notion([]) == []
+
+
+def test_convert_markdown_to_notion_cache_returns_independent_copies(monkeypatch):
+    """Test that cached conversions match fresh ones and are safe to mutate."""
+    monkeypatch.setenv("PANDOC_NOTION_CACHE", "1")
+    convert_markdown_to_notion.cache_clear()
+    markdown = "Cached paragraph with *emphasis*."
+    
+    first = convert_markdown_to_notion(markdown)
+    first["children"].clear()
+    second = convert_markdown_to_notion(markdown)
+    
+    assert len(second["children"]) == 1
+    assert second["children"][0]["type"] == "paragraph"
+    
+    convert_markdown_to_notion.cache_clear()
+    monkeypatch.delenv("PANDOC_NOTION_CACHE")
+    assert convert_markdown_to_notion(markdown) == second
+
+
+def test_registry_mixin_lookup_follows_registered_managers():
+    """Test that managers found through RegistryMixin reflect later registrations."""
+    import panflute as pf
+    from pandoc_notion.managers.base import Manager
+    from pandoc_notion.managers.registry_mixin import RegistryMixin
+    from pandoc_notion.registry import ManagerRegistry
+    
+    class RuleManager(Manager):
+        @classmethod
+        def can_convert(cls, elem):
+            return isinstance(elem, pf.HorizontalRule)
+        
+        @classmethod
+        def convert(cls, elem):
+            return []
+        
+        @classmethod
+        def to_dict(cls, elem):
+            return []
+    
+    registry = ManagerRegistry()
+    rule = pf.HorizontalRule()
+    assert RegistryMixin.find_manager(rule) is None
+    
+    registry.register_manager(RuleManager)
+    assert RegistryMixin.find_manager(rule) is RuleManager
+    
+    ManagerRegistry()
+    assert RegistryMixin.find_manager(rule) is None
+
+
+def test_convert_markdown_to_notion_survives_registry_rebinding():
+    """Test that nested conversions use the default managers after another registry was created."""
+    from pandoc_notion.managers.heading_manager import HeadingManager
+    from pandoc_notion.registry import ManagerRegistry
+    
+    markdown = "> a\n>\n> b"
+    expected = convert_markdown_to_notion(markdown)
+    assert expected["children"][0]["quote"]["children"]
+    
+    # Creating a registry installs it as the shared registry for nested lookups
+    ManagerRegistry([HeadingManager])
+    
+    assert convert_markdown_to_notion(markdown) == expected
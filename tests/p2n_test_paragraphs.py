@@ -290,3 +290,27 @@ def test_paragraph_with_mixed_formatting(request):
         'notes': 'Shows how nested formatting and code are represented in Notion API'
     })
 
+
+
+def test_paragraph_to_dict_matches_converted_block():
+    """Test that to_dict serializes the same block as converting and then calling to_dict."""
+    para = create_formatted_para([("Plain ", None), ("bold", "bold"), (" and ", None), ("code", "code")])
+    
+    assert ParagraphManager.to_dict(para) == [ParagraphManager.convert(para)[0].to_dict()]
+    
+    with pytest.raises(ValueError):
+        ParagraphManager.to_dict(pf.Plain(pf.Str("not a paragraph")))
+
+
+def test_plain_paragraph_matches_text_manager_output():
+    """Test that paragraphs of only Str and Space elements convert like any other inline content."""
+    paras = [
+        pf.Para(pf.Str("Just"), pf.Space(), pf.Str("plain"), pf.Space(), pf.Str("words")),
+        pf.Para(pf.Space()),
+        pf.Para(),
+    ]
+    
+    for para in paras:
+        expected = Paragraph(TextManager.create_text_elements(para.content)).to_dict()
+        assert ParagraphManager.convert(para)[0].to_dict() == expected
+        assert ParagraphManager.to_dict(para) == [expected]